@@ -27,10 +27,11 @@ class Application(Gtk.Application):
         self.presets = Config('presets.json').load()
         self.templates = Config('templates.json').load()
 
-        # Extract all presets
+        # Extract all presets once so they can be reused whenever a preset is selected
         presets = {}
         for name, preset in self.presets.items():
             presets[name] = [Preset(bounds) for bounds in preset]
+        self.zone_presets = presets
 
         templates = {}
         for name, preset in self.templates.items():
@@ -97,8 +98,9 @@ class Application(Gtk.Application):
             case State.SET_ZONE:
                 for i, name in self.settings.zonemap.items():
                     if keyboard.KeyCode.from_char(i) == key:
-                        self.zone_display_window.set_preset([Preset(preset) for preset in self.presets.get(name)])
-                        self.zone_display_window.show_all()
+                        self.zone_display_window.set_preset(self.zone_presets.get(name))
+                        self.current_zone = None  # No zone of the new preset is active yet
+                        self.zone_display_window.show()
 
     def __key_release_callback(self, key):
         match self.state:
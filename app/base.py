@@ -59,11 +59,25 @@ class Preset:
         :param bounds: A Gdk.Rectangle providing the scaling reference.
         :return: A Gdk.Rectangle object representing the scaled bounds of the preset.
         """
+        return self.scale_values(bounds.x, bounds.y, bounds.width, bounds.height)
+
+    def scale_values(self, x: int, y: int, width: int, height: int) -> Gdk.Rectangle:
+        """
+        Scales the preset dimensions based on the provided bounding values.
+
+        Behaves like scale but takes plain values, allowing callers scaling many presets to the same bounds to read the
+        bounds once rather than once per preset.
+        :param x: The x-coordinate of the scaling reference.
+        :param y: The y-coordinate of the scaling reference.
+        :param width: The width of the scaling reference.
+        :param height: The height of the scaling reference.
+        :return: A Gdk.Rectangle object representing the scaled bounds of the preset.
+        """
         new_bounds = Gdk.Rectangle()
-        new_bounds.x = bounds.x + bounds.width * self.x
-        new_bounds.y = bounds.y + bounds.height * self.y
-        new_bounds.width = bounds.width * self.width
-        new_bounds.height = bounds.height * self.height
+        new_bounds.x = x + width * self.x
+        new_bounds.y = y + height * self.y
+        new_bounds.width = width * self.width
+        new_bounds.height = height * self.height
         return new_bounds
 
 
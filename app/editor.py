@@ -51,6 +51,7 @@ class ZoneEditorWindow(TransparentApplicationWindow):
         __overlay (Gtk.Overlay): The overlay widget for combining multiple widgets on top of one another.
         __container (zones.ZoneContainer): A container holding ZonePane objects.
         __editor (Gtk.Fixed): A fixed container holding BoundPoints.
+        __points (list): The BoundPoints held by the editor, kept to avoid querying GTK for them on every event.
         __edge_divider (Line): A line widget used for visualizing new edge positions before dividing.
         __point_allocation_handler_id (int): The ID for the size-allocate signal handler.
         __threshold (int): Defines a threshold for boundary proximity detection.
@@ -73,6 +74,7 @@ class ZoneEditorWindow(TransparentApplicationWindow):
         self.__overlay = Gtk.Overlay()
         self.__container = ZoneContainer(preset).add_zone_style_class('zone-pane', 'passive-zone')
         self.__editor = Gtk.Fixed()
+        self.__points = []
         self.__edge_divider = Line(0, 0, 0, 0)
 
         # Add Line to represent edge division
@@ -88,6 +90,7 @@ class ZoneEditorWindow(TransparentApplicationWindow):
             point = BoundPoint(boundary)
             point.connect("motion-notify-event", self.__on_bound_point_motion)
             self.__editor.add(point)
+            self.__points.append(point)
 
         # Connect Gtk signals to handlers
         self.add_events(Gdk.EventMask.POINTER_MOTION_MASK | Gdk.EventMask.KEY_PRESS_MASK | Gdk.EventMask.KEY_RELEASE_MASK)
@@ -105,7 +108,7 @@ class ZoneEditorWindow(TransparentApplicationWindow):
         """
         self.__threshold = min(allocation.width, allocation.height) * 0.05
         size = min(allocation.width, allocation.height) * 0.025
-        for point in self.__editor.get_children():
+        for point in self.__points:
             point.set_size_request(size, size)
             point.hide()
         self.disconnect(self.__point_allocation_handler_id)
@@ -132,7 +135,7 @@ class ZoneEditorWindow(TransparentApplicationWindow):
         :param widget: The widget that received the event.
         :param event: The event object containing information about the motion event.
         """
-        for point in self.__editor.get_children():
+        for point in self.__points:
             point_offset = point.get_allocated_width() / 2  # Calculate the offset for the point
             x, y = point.boundary.get_center()
             # Check proximity to pointer based on the axis of the boundary
@@ -190,10 +193,9 @@ class ZoneEditorWindow(TransparentApplicationWindow):
         assert self.get_allocated_width() != 0 and self.get_allocated_height() != 0, \
             f'Allocated width and/or height is zero. {self.__class__.__name__} must be size allocated before use.'
 
-        for zone in self.__container.get_children():
-            allocation = zone.get_allocation()
-            if allocation.x <= x < allocation.x + allocation.width and allocation.y <= y < allocation.y + allocation.height:
-                return allocation
+        zone = self.__container.get_zone(x, y)
+        if zone is not None:
+            return zone.get_bounds_rectangle()
 
     def show_all(self):
         """
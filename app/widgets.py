@@ -1,3 +1,5 @@
+import math
+
 import cairo
 import gi
 gi.require_version('Gtk', '3.0')
@@ -9,6 +11,8 @@ class Line(Gtk.DrawingArea):
 
     __gtype_name__ = 'Line'
 
+    line_width = 1.25  # The width of the drawn line in pixels
+
     def __init__(self, x1, y1, x2, y2):
         """
         Initializes a Line widget with specified coordinates.
@@ -33,25 +37,37 @@ class Line(Gtk.DrawingArea):
         :param cr: The Cairo context used for drawing.
         """
         cr.set_source_rgb(0.05, 0.05, 0.05)
-        cr.set_line_width(1.25)
+        cr.set_line_width(self.line_width)
         cr.move_to(self.x1, self.y1)
         cr.line_to(self.x2, self.y2)
         cr.stroke()
 
     def set_position(self, x1, y1, x2, y2):
         """
-        Sets new coordinates for the line and queues a redraw.
+        Sets new coordinates for the line and queues a redraw of the areas covered by the old and new line.
 
         :param x1: New X-coordinate of the starting point.
         :param y1: New Y-coordinate of the starting point.
         :param x2: New X-coordinate of the ending point.
         :param y2: New Y-coordinate of the ending point.
         """
+        self.__queue_draw_line()  # Queue a redraw to clear the old line
         self.x1 = x1
         self.y1 = y1
         self.x2 = x2
         self.y2 = y2
-        self.queue_draw()  # Queue a redraw to update the line
+        self.__queue_draw_line()  # Queue a redraw to draw the new line
+
+    def __queue_draw_line(self):
+        """
+        Queues a redraw of only the area covered by the line rather than the whole drawing area.
+        """
+        margin = math.ceil(self.line_width)  # Include the stroke width around the line
+        left = math.floor(min(self.x1, self.x2)) - margin
+        top = math.floor(min(self.y1, self.y2)) - margin
+        right = math.ceil(max(self.x1, self.x2)) + margin
+        bottom = math.ceil(max(self.y1, self.y2)) + margin
+        self.queue_draw_area(left, top, right - left, bottom - top)
 
 
 # Register the custom widget type
@@ -1,30 +1,71 @@
 import gi
-from itertools import groupby
 
 from shapely.geometry import LineString
-from shapely.ops import linemerge
 
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk
+from gi.repository import Gtk, Gdk
 
 from base import Axis, Side, Preset, PresetableMixin, GtkStyleableMixin, TransparentApplicationWindow
 
 
+# The axis along which each side of a zone moves
+_SIDE_AXIS = {Side.LEFT: Axis.x, Side.RIGHT: Axis.x, Side.TOP: Axis.y, Side.BOTTOM: Axis.y}
+
+
 class ZonePane(PresetableMixin, GtkStyleableMixin, Gtk.Box):
-    """A custom Gtk.Box that represets a basic zone area."""
+    """
+    A custom Gtk.Box that represets a basic zone area.
+
+    Attributes:
+        bounds (tuple): The (x, y, width, height) of the latest allocation, readable without querying GTK.
+        version (int): Incremented on every allocation so cached geometry derived from the ZonePane can be invalidated.
+    """
     def __init__(self, preset: Preset):
         """
         :param preset: A Preset object containing configuration for the ZonePane.
         """
         Gtk.Box.__init__(self)
         PresetableMixin.__init__(self, preset)
+        self.bounds = (0, 0, 0, 0)
+        self.version = 0
         self.label = Gtk.Label()
         self.set_center_widget(self.label)
+        # Do not invalidate the whole pane on every allocation; a moved ZoneBoundary redraws only the area it changed
+        self.set_redraw_on_allocate(False)
 
         # If the preset has a label assign it
         if self.preset.label:
             self.label.set_text(self.preset.label)
 
+        self.connect('size-allocate', self.__on_size_allocate)
+
+    def __on_size_allocate(self, widget, allocation) -> None:
+        """
+        Handles the size-allocate signal to record the new bounds and mark geometry derived from the previous
+        allocation as stale.
+        :param widget: The widget that received the signal.
+        :param allocation: The allocation (Gtk.Allocation) containing the new size.
+        """
+        self.bounds = (allocation.x, allocation.y, allocation.width, allocation.height)
+        self.version += 1
+
+    def get_bounds_rectangle(self) -> Gdk.Rectangle:
+        """
+        Builds a Gdk.Rectangle from the bounds recorded on the latest allocation, without querying GTK.
+        :return: A new Gdk.Rectangle holding the bounds of the ZonePane.
+        """
+        rectangle = Gdk.Rectangle()
+        rectangle.x, rectangle.y, rectangle.width, rectangle.height = self.bounds
+        return rectangle
+
+    def set_preset(self, preset: Preset) -> None:
+        """
+        Assigns a new Preset to the ZonePane so the widget can be reused for a different zone layout.
+        :param preset: A Preset object containing the new configuration for the ZonePane.
+        """
+        self.preset = preset
+        self.label.set_text(preset.label or '')
+
 
 class ZoneEdge:
     """
@@ -34,7 +75,11 @@ class ZoneEdge:
         zone (ZonePane): The ZonePane object associated with this edge.
         side (Side): The specific side (TOP, BOTTOM, LEFT, RIGHT) of the ZonePane.
         axis (Axis): The axis (x or y) corresponding to the side.
+        coord (float|int): The normalized position of the side on its axis.
+        start (float|int): The normalized position where the side begins along the opposite axis.
+        end (float|int): The normalized position where the side ends along the opposite axis.
     """
+    __slots__ = ('zone', 'side', 'axis', 'coord', 'start', 'end', '__interval', '__interval_version')
 
     def __init__(self, zone: ZonePane, side: Side):
         """
@@ -44,7 +89,11 @@ class ZoneEdge:
         """
         self.zone = zone  # The ZonePane object associated with this side
         self.side = side  # The specific side of the ZonePane
-        self.axis = Axis.x if side in {Side.LEFT, Side.RIGHT} else Axis.y  # Determine the axis based on the side
+        self.axis = _SIDE_AXIS[side]  # Determine the axis based on the side
+        self.__interval = None  # Cached interval derived from the zone allocation
+        self.__interval_version = None  # The zone version at which the cached interval was computed
+        # Normalized position as plain values
+        self.coord, self.start, self.end = self.__get_interval(zone.preset.x, zone.preset.y, zone.preset.width, zone.preset.height)
 
     def get_position(self, normalized=False) -> LineString:
         """
@@ -52,16 +101,45 @@ class ZoneEdge:
         :param normalized: Returns normalized position if True.
         :return: A LineString representing the position of the side.
         """
-        bounds = self.zone.preset if normalized else self.zone.get_allocation()
+        coord, start, end = self.get_interval(normalized)
+        if self.axis is Axis.x:
+            return LineString([(coord, start), (coord, end)])
+        return LineString([(start, coord), (end, coord)])
+
+    def get_interval(self, normalized=False) -> tuple:
+        """
+        Gets the position of a ZonePanes side as plain values, without building any geometry.
+
+        The allocated interval is cached and only recomputed after the zone has been allocated a new size.
+        :param normalized: Returns normalized interval if True.
+        :return: A tuple (coord, start, end) of the side's position on its axis and its extent along the opposite axis.
+        """
+        if normalized:
+            return self.coord, self.start, self.end
+
+        if self.__interval_version != self.zone.version:
+            self.__interval = self.__get_interval(*self.zone.bounds)  # Read the bounds recorded on allocation
+            self.__interval_version = self.zone.version
+        return self.__interval
+
+    def __get_interval(self, x, y, width, height) -> tuple:
+        """
+        Computes the position of this side from the given bounds as plain values.
+        :param x: The x-coordinate of the bounds.
+        :param y: The y-coordinate of the bounds.
+        :param width: The width of the bounds.
+        :param height: The height of the bounds.
+        :return: A tuple (coord, start, end) of the side's position on its axis and its extent along the opposite axis.
+        """
         match self.side:
             case Side.TOP:
-                return LineString([(bounds.x, bounds.y), (bounds.x + bounds.width, bounds.y)])
+                return y, x, x + width
             case Side.BOTTOM:
-                return LineString([(bounds.x, bounds.y + bounds.height), (bounds.x + bounds.width, bounds.y + bounds.height)])
+                return y + height, x, x + width
             case Side.LEFT:
-                return LineString([(bounds.x, bounds.y), (bounds.x, bounds.y + bounds.height)])
+                return x, y, y + height
             case Side.RIGHT:
-                return LineString([(bounds.x + bounds.width, bounds.y), (bounds.x + bounds.width, bounds.y + bounds.height)])
+                return x + width, y, y + height
 
 
 class ZoneBoundary:
@@ -69,8 +147,11 @@ class ZoneBoundary:
     Represents a boundary formed by multiple ZoneEdge objects, allowing manipulation of their positions.
 
     Attributes:
-        __edges (set): A set of ZoneEdge objects forming the edge.
+        __edges (tuple): A tuple of the unique ZoneEdge objects forming the edge.
         axis (Axis): The axis (x or y) along which the edge is aligned.
+        __bounds (tuple): Cached (minx, miny, maxx, maxy) extent of the boundary.
+        __center (tuple): Cached center point of the boundary.
+        __position_versions (tuple or None): Versions of the edge zones at which the extent was cached.
     """
 
     def __init__(self, edges: [ZoneEdge]):
@@ -78,7 +159,10 @@ class ZoneBoundary:
         Initializes the ZoneBoundary with a list of ZoneEdge objects.
         :param edges: A list of ZoneEdge objects forming the edge.
         """
-        self.__edges = set()  # Initialize an empty set for ZoneEdge objects
+        self.__edges = ()  # Initialize an empty tuple for ZoneEdge objects
+        self.__bounds = None
+        self.__center = None
+        self.__position_versions = None
         self.axis = self.__get_axis(edges)  # Determine the axis of the edge
         self.add_edges(edges)  # Add the sides to the edge
 
@@ -88,16 +172,14 @@ class ZoneBoundary:
         :param edges: A list of ZoneEdge objects to check.
         :return: True if the sides form a valid edge, False otherwise.
         """
-        lines = [edge.get_position(normalized=True) for edge in edges]  # Get positions of the edges
-        lines.sort(key=lambda line: line.bounds[0])  # Sort lines by their starting position on the axis
-        axis_position = lines[0].coords[0][self.axis.value]  # Get the position on the axis
+        edges = sorted(edges, key=lambda edge: edge.start)  # Sort edges by their starting position along the line
+        axis_position, end = edges[0].coord, edges[0].end  # Get the position on the axis and where the line ends
 
-        # Verify that all LineString are contiguous and aligned
-        for line1, line2 in zip(lines, lines[1:]):
-            aligned = any(coord[self.axis.value] == axis_position for coord in line2.coords)
-            connected = line1.touches(line2) or line1.intersects(line2)
-            if not connected or not aligned:
+        # Verify that all edges are aligned and each begins before the edges preceding it have ended
+        for edge in edges[1:]:
+            if edge.coord != axis_position or edge.start > end:
                 return False
+            end = max(end, edge.end)
         return True
 
     def __get_axis(self, edges: [ZoneEdge]) -> Axis:
@@ -118,42 +200,69 @@ class ZoneBoundary:
         """
         assert self.axis is self.__get_axis(edges), f'A ZoneBoundary must only contain ZoneEdges of the same axis. Current axis is {self.axis.name}.'
 
-        # Copy the current set of edges and add the new edges
-        new_edges = self.__edges.copy()
-        new_edges.update(edges)
+        # Combine the current and new edges, dropping duplicates while keeping their order
+        new_edges = tuple(dict.fromkeys((*self.__edges, *edges)))
 
-        # Check if the new set of edges forms a valid boundary
+        # Check if the combined edges form a valid boundary
         if self.__is_edge(new_edges):
-            self.__edges.update(edges)  # Update the set of edges with the new valid edges
+            self.__edges = new_edges  # Replace the edges with the new valid edges
+            self.__position_versions = None  # Invalidate the cached extent
         return self
 
+    def __update_position(self) -> None:
+        """
+        Recomputes the cached extent and center if a zone of the boundary has been allocated since they were cached.
+        """
+        versions = tuple(edge.zone.version for edge in self.__edges)
+        if versions == self.__position_versions:
+            return
+
+        intervals = [edge.get_interval() for edge in self.__edges]  # Get intervals of the edges
+        # The edges are aligned, so the boundary spans the extremes of their intervals on each axis
+        low = min(interval[0] for interval in intervals)
+        high = max(interval[0] for interval in intervals)
+        start = min(interval[1] for interval in intervals)
+        end = max(interval[2] for interval in intervals)
+        if self.axis is Axis.x:
+            minx, miny, maxx, maxy = low, start, high, end
+        else:
+            minx, miny, maxx, maxy = start, low, end, high
+        self.__bounds = (minx, miny, maxx, maxy)
+        self.__center = (minx + maxx) / 2, (miny + maxy) / 2
+        self.__position_versions = versions
+
     def get_center(self) -> tuple[float, float]:
         """
         Calculates and returns the center point of the line segment.
+
+        The center is cached and only recalculated after a zone of the boundary has been allocated a new size.
         :return: A tuple (center_x, center_y) representing the center point of the line.
         """
-        minx, miny, maxx, maxy = self.get_position().bounds  # Get the bounds of the edge
-        center_x = (minx + maxx) / 2  # Calculate the center x-coordinate
-        center_y = (miny + maxy) / 2  # Calculate the center y-coordinate
-        return center_x, center_y
+        self.__update_position()
+        return self.__center
 
     def get_position(self) -> LineString:
         """
         Gets the position of the ZoneBoundary as a LineString.
+
+        The LineString is built from the cached extent on each call, so callers that only need the center never create
+        one.
         :return: A LineString representing the position of the boundary.
         """
-        lines = [edges.get_position() for edges in self.__edges]  # Get positions of the edges
-        bounds = linemerge(lines).bounds  # Merge the lines and get the bounds
-        return LineString([(bounds[0], bounds[1]), (bounds[2], bounds[3])])  # Create a LineString from the bounds
+        self.__update_position()
+        minx, miny, maxx, maxy = self.__bounds
+        return LineString([(minx, miny), (maxx, maxy)])  # Create a LineString from the bounds
 
     def move_horizontal(self, position: int) -> None:
         """
-        Moves the edge horizontally to a new position.
+        Moves the edge horizontally to a new position. Does nothing if the edge is already at the position.
         :param position: Pixel value of a new position to move the edge.
         """
-        if self.axis is Axis.x:
+        if self.axis is Axis.x and position != self.get_center()[0]:
+            damaged = []  # Bounds of the zones before and after they are moved
             for edge in self.__edges:
-                allocation = edge.zone.get_allocation()
+                damaged.append(edge.zone.bounds)
+                allocation = edge.zone.get_bounds_rectangle()
                 if edge.side is Side.LEFT:
                     # Adjust the width and x-position when moving the left edge
                     allocation.width = (allocation.x + allocation.width) - position
@@ -162,15 +271,19 @@ class ZoneBoundary:
                     # Adjust the width when moving the right edge
                     allocation.width = position - allocation.x
                 edge.zone.size_allocate(allocation)
+                damaged.append(edge.zone.bounds)
+            self.__queue_draw(damaged)
 
     def move_vertical(self, position: int) -> None:
         """
-        Moves the edge vertically to a new position.
+        Moves the edge vertically to a new position. Does nothing if the edge is already at the position.
         :param position: Pixel value of a new position to move the edge.
         """
-        if self.axis is Axis.y:
+        if self.axis is Axis.y and position != self.get_center()[1]:
+            damaged = []  # Bounds of the zones before and after they are moved
             for edge in self.__edges:
-                allocation = edge.zone.get_allocation()
+                damaged.append(edge.zone.bounds)
+                allocation = edge.zone.get_bounds_rectangle()
                 if edge.side is Side.TOP:
                     # Adjust the height and y-position when moving the top edge
                     allocation.height = (allocation.y + allocation.height) - position
@@ -179,6 +292,26 @@ class ZoneBoundary:
                     # Adjust the height when moving the bottom edge
                     allocation.height = position - allocation.y
                 edge.zone.size_allocate(allocation)
+                damaged.append(edge.zone.bounds)
+            self.__queue_draw(damaged)
+
+    def __queue_draw(self, bounds: [tuple]) -> None:
+        """
+        Queues a redraw of only the area of the container covered by the zones of the boundary before and after they
+        have been moved.
+        :param bounds: A list of (x, y, width, height) bounds of the moved zones.
+        """
+        container = self.__edges[0].zone.get_parent()
+        if container is None:
+            return
+
+        # Union of the bounds, which are relative to the window, converted to be relative to the container
+        origin = container.get_allocation()
+        x1 = min(x for x, y, width, height in bounds)
+        y1 = min(y for x, y, width, height in bounds)
+        x2 = max(x + width for x, y, width, height in bounds)
+        y2 = max(y + height for x, y, width, height in bounds)
+        container.queue_draw_area(x1 - origin.x, y1 - origin.y, x2 - x1, y2 - y1)
 
 
 class ZonePanePositionGraph:
@@ -191,96 +324,92 @@ class ZonePanePositionGraph:
 
         This constructor processes the given zones to create a list of ZoneBoundary's by:
         1. Filtering all x-axis and y-axis sides into separate lists.
-        2. Sorting and grouping the sides by their respective axes.
-        3. Removing sides that border the screen edges.
-        4. Creating ZoneBoundary's from the grouped sides.
+        2. Sorting the sides by their respective axes and removing sides that border the screen edges.
+        3. Creating ZoneBoundary's from the contiguous sides.
 
         :param zones: List of ZonePane objects to be processed.
         """
         super().__init__()
         self.boundaries = []  # Initialize the list to store ZoneBoundary objects
 
-        # Filter all x-axis and y-axis sides into separate lists
-        x_sides, y_sides = [], []
-        for zone in zones:
-            x_sides.append(ZoneEdge(zone, Side.LEFT))
-            x_sides.append(ZoneEdge(zone, Side.RIGHT))
-            y_sides.append(ZoneEdge(zone, Side.TOP))
-            y_sides.append(ZoneEdge(zone, Side.BOTTOM))
-
-        # Order sides by axis and group matching values of the opposite axis after sorting
-        x_sides = self.__sort_and_group(x_sides, Axis.x)
-        y_sides = self.__sort_and_group(y_sides, Axis.y)
+        # A single zone only borders the container, so there are no boundaries to find
+        if len(zones) < 2:
+            return
 
-        # Remove all sides that border the container edges
-        if len(x_sides) >= 2:
-            x_sides = x_sides[1:-1]  # Remove the left and right container edges from x_sides
-        if len(y_sides) >= 2:
-            y_sides = y_sides[1:-1]  # Remove the top and bottom container edges from y_sides
+        # Filter all x-axis and y-axis sides into separate lists
+        x_sides = [ZoneEdge(zone, side) for zone in zones for side in (Side.LEFT, Side.RIGHT)]
+        y_sides = [ZoneEdge(zone, side) for zone in zones for side in (Side.TOP, Side.BOTTOM)]
 
-        # Create ZoneBoundary's from the grouped sides
-        for group in x_sides:
-            boundaries = self.__get_zone_boundaries(group)
-            self.boundaries.extend(boundaries)
+        # Order sides by axis and remove all sides that border the container edges
+        x_sides = self.__sort_and_trim(x_sides)
+        y_sides = self.__sort_and_trim(y_sides)
 
-        for group in y_sides:
-            boundaries = self.__get_zone_boundaries(group)
-            self.boundaries.extend(boundaries)
+        # Create ZoneBoundary's from the contiguous sides
+        self.boundaries.extend(self.__get_zone_boundaries(x_sides))
+        self.boundaries.extend(self.__get_zone_boundaries(y_sides))
 
-    def __sort_and_group(self, edges: list[ZoneEdge], axis: Axis) -> list[list[ZoneEdge]]:
+    def __sort_and_trim(self, edges: list[ZoneEdge]) -> list[ZoneEdge]:
         """
-        Sorts a list of ZoneEdge objects based on their positions along a given axis and then groups them.
+        Sorts a list of ZoneEdge objects based on their positions along their axis and removes the container edges.
 
-        The method first sorts the edges based on the specified axis. If the axis is x, it sorts by the x-coordinate;
-        if the axis is y, it sorts by the y-coordinate. After sorting, it groups the edges by their position on the
-        opposite axis.
+        The method buckets the edges by their position on their axis in a single pass, drops the buckets at the first
+        and last positions since those edges border the container, and sorts each remaining bucket by starting position
+        on the opposite axis so aligned edges are ordered along the line they share. Positions are read from the
+        normalized values precomputed on each ZoneEdge, so no geometry is built while sorting.
 
-        :param edges: List of ZoneEdge objects to be sorted and grouped.
-        :param axis: The axis (x or y) to use for sorting and grouping.
-        :return: A list of lists, where each sublist contains ZoneEdge objects grouped by their position
-                 on the opposite axis.
+        :param edges: List of ZoneEdge objects of the same axis to be sorted and trimmed.
+        :return: A list of ZoneEdge objects which do not border the container, ordered along each shared line.
         """
-        # Determine the opposite axis for sorting
-        op_axis = Axis.x.value if axis is Axis.x else Axis.y.value
-
-        # Sort edges by their positions along the opposite axis and the given axis
-        edges.sort(key=lambda edge: (
-            edge.get_position(normalized=True).bounds[op_axis],
-            edge.get_position(normalized=True).bounds[axis.value]
-        ))
+        if not edges:
+            return []
 
-        # Group the sorted sides by their position along the opposite axis
-        grouped_edges = [list(g) for k, g in groupby(edges, key=lambda edge: edge.get_position(normalized=True).bounds[op_axis])]
+        # Bucket edges by their position on the axis
+        buckets = {}
+        for edge in edges:
+            buckets.setdefault(edge.coord, []).append(edge)
 
-        return grouped_edges
+        # Keep only the buckets strictly between the first and last positions on the axis
+        first, last = min(buckets), max(buckets)
+        trimmed = []
+        for coord, bucket in buckets.items():
+            if coord != first and coord != last:
+                bucket.sort(key=lambda edge: edge.start)
+                trimmed.extend(bucket)
+        return trimmed
 
     def __get_zone_boundaries(self, edges: list[ZoneEdge]) -> list[ZoneBoundary]:
         """
         Processes a list of ZoneEdge objects to group contiguous sides into ZoneBoundary objects.
 
-        This method iterates through the list of sides, identifying groups of contiguous sides based on their positions.
-        It then creates ZoneBoundary objects for each group of contiguous sides and returns a list of these ZoneBoundary objects.
+        This method sweeps through the list of sides, which must be ordered by their starting position along each shared
+        line, tracking the furthest end of the current group so a side joins it whenever it begins before any side of the
+        group has ended. It then creates ZoneBoundary objects for each group of contiguous sides and returns a list of
+        these ZoneBoundary objects.
 
         :param edges: List of ZoneEdge objects to be processed into ZoneBoundary objects.
         :return: A list of ZoneBoundary objects, each representing a group of aligned contiguous ZoneEdges.
         """
+        if not edges:
+            return []
+
         boundaries = []  # Initialize the list to store ZoneBoundary objects
         contigous_group = [edges[0]]  # Start with the first side in the contiguous group
-
-        # Iterate through pairs of consecutive sides
-        for side1, side2 in zip(edges, edges[1:]):
-            line1, line2 = side1.get_position(normalized=True), side2.get_position(normalized=True)
-            # Check if the current side is contiguous with the next side
-            if line1.touches(line2) or line1.intersects(line2):
-                contigous_group.append(side2)  # Add to the current contiguous group
+        axis_position, end = edges[0].coord, edges[0].end  # Track the position and furthest end of the group
+
+        # Sweep through the sides, which are ordered by their starting position along each shared line
+        for side in edges[1:]:
+            # Check if the side is aligned with the group and begins before the group has ended
+            if side.coord == axis_position and side.start <= end:
+                contigous_group.append(side)  # Add to the current contiguous group
+                end = max(end, side.end)
             else:
-                # Split the group and start a new one since they aren't contiguous but do align
+                # Split the group and start a new one since they aren't contiguous or aligned
                 boundaries.append(ZoneBoundary(contigous_group))  # Create a ZoneBoundary for the current group
-                contigous_group = [side2]  # Start a new group with the next side
+                contigous_group = [side]  # Start a new group with the next side
+                axis_position, end = side.coord, side.end
 
-        # Add the remaining sides as a ZoneBoundary if there are any left
-        if len(contigous_group) != 0:
-            boundaries.append(ZoneBoundary(contigous_group))
+        # Add the remaining sides as a ZoneBoundary
+        boundaries.append(ZoneBoundary(contigous_group))
 
         return boundaries  # Return the list of ZoneBoundary objects
 
@@ -291,6 +420,8 @@ class ZoneContainer(Gtk.Fixed):
 
     Attributes:
         position_graph (ZonePanePositionGraph): Graph representing positions of ZonePane objects.
+        __zone_style_classes (list): Style classes added to all ZonePane children, applied to ZonePanes added later.
+        __zones (dict): The ZonePane children of the container as ordered keys, kept to avoid querying GTK for them.
     """
 
     def __init__(self, preset: [Preset]):
@@ -299,22 +430,92 @@ class ZoneContainer(Gtk.Fixed):
         :param preset: A list of Preset objects to initialize ZonePane objects.
         """
         super().__init__()
+        self.__zone_style_classes = []
+        self.__zones = {}
         for preset in preset:
-            self.add(ZonePane(preset))  # Add ZonePane objects to the container
+            self.__add_zone(preset)  # Add ZonePane objects to the container
 
         self.connect('size-allocate', self.__on_size_allocate)
 
+    def __add_zone(self, preset: Preset) -> ZonePane:
+        """
+        Creates a ZonePane from a Preset and adds it to the container.
+        :param preset: A Preset object to initialize the ZonePane.
+        :return: The new ZonePane object.
+        """
+        zone = ZonePane(preset).add_style_class(*self.__zone_style_classes)
+        self.add(zone)
+        self.__zones[zone] = None
+        return zone
+
     def __on_size_allocate(self, widget, allocation) -> None:
         """
         Handles the size-allocate signal to scale and allocate sizes for child ZonePane objects.
         :param widget: The widget that received the signal.
         :param allocation: The allocation (Gtk.Allocation) containing the new size.
         """
-        for child in self.get_children():
-            child.size_allocate(child.preset.scale(allocation))
+        # Read the allocation once rather than once per child
+        x, y, width, height = allocation.x, allocation.y, allocation.width, allocation.height
+        for child in self.__zones:
+            child.size_allocate(child.preset.scale_values(x, y, width, height))
+
+    def get_zone(self, x, y) -> ZonePane:
+        """
+        Retrieves the ZonePane object at the specified coordinates.
+
+        Reads the bounds each ZonePane records on allocation, so lookups from pointer events do not query the allocation
+        of any child.
+        :param x: The x-coordinate.
+        :param y: The y-coordinate.
+        :return: The ZonePane object at the specified coordinates, or None if there is none.
+        """
+        for zone in self.__zones:
+            zone_x, zone_y, width, height = zone.bounds
+            if zone_x <= x < zone_x + width and zone_y <= y < zone_y + height:
+                return zone
+
+    def get_zones(self) -> [ZonePane]:
+        """
+        Retrieves all ZonePane objects within the container.
+        :return: A list of ZonePane objects.
+        """
+        return list(self.__zones)
+
+    def has_zone(self, zone: ZonePane) -> bool:
+        """
+        Checks whether a ZonePane is a child of the container without scanning its children.
+        :param zone: The ZonePane object to check.
+        :return: True if the ZonePane is a child of the container, False otherwise.
+        """
+        return zone in self.__zones
 
     def get_position_graph(self):
-        return ZonePanePositionGraph(self.get_children())
+        return ZonePanePositionGraph(list(self.__zones))
+
+    def set_preset(self, preset: [Preset]) -> 'ZoneContainer':
+        """
+        Sets a new list of Preset objects for the container, reusing the existing ZonePane objects.
+
+        Existing ZonePanes are assigned the new presets in order, so ZonePanes are only created or removed for the
+        difference in the number of zones. Created ZonePanes receive the style classes previously added with
+        add_zone_style_class.
+        :param preset: A new list of Preset objects.
+        :return: The ZoneContainer object itself for chaining calls.
+        """
+        zones = list(self.__zones)
+        for zone, zone_preset in zip(zones, preset):
+            zone.set_preset(zone_preset)  # Reuse the existing ZonePane for the new preset
+        for zone in zones[len(preset):]:
+            self.remove(zone)  # Remove ZonePanes which are no longer needed
+            del self.__zones[zone]
+        for zone_preset in preset[len(zones):]:
+            zone = self.__add_zone(zone_preset)  # Add ZonePanes for the additional presets
+            if self.is_visible():
+                zone.show_all()
+
+        self.queue_resize()  # Reallocate the ZonePanes to their new presets
+        self.queue_draw()  # ZonePanes do not redraw on allocation, so redraw the container
+        return self
 
     def add_zone_style_class(self, *style_classes):
         """
@@ -322,7 +523,8 @@ class ZoneContainer(Gtk.Fixed):
         :param style_classes: One or more style class names to add.
         :return: The ZoneContainer object itself for chaining calls.
         """
-        for child in self.get_children():
+        self.__zone_style_classes.extend(style_classes)
+        for child in self.__zones:
             child.add_style_class(*style_classes)  # Add style classes to each child
         return self
 
@@ -354,7 +556,7 @@ class ZoneDisplayWindow(TransparentApplicationWindow):
         Retrieves all ZonePane objects within the container.
         :return: A list of ZonePane objects.
         """
-        return self.__container.get_children()
+        return self.__container.get_zones()
 
     def get_zone(self, x, y) -> ZonePane:
         """
@@ -367,17 +569,14 @@ class ZoneDisplayWindow(TransparentApplicationWindow):
         assert self.get_allocated_width() != 0 and self.get_allocated_height() != 0, \
             f'Allocated width and/or height is zero. {self.__class__.__name__} must be size allocated before use.'
 
-        for zone in self.__container.get_children():
-            allocation = zone.get_allocation()
-            if allocation.x <= x < allocation.x + allocation.width and allocation.y <= y < allocation.y + allocation.height:
-                return zone
+        return self.__container.get_zone(x, y)
 
     def set_active(self, zone: ZonePane) -> None:
         """
         Sets the specified ZonePane as the active zone.
         :param zone: The ZonePane object to set as active.
         """
-        assert zone in self.__container.get_children(), f"Zone must be a child of {self.__container.__class__.__name__}"
+        assert self.__container.has_zone(zone), f"Zone must be a child of {self.__container.__class__.__name__}"
         if self.__active_zone:
             # Remove the active style from the previously active zone
             self.__active_zone.remove_style_class('active-zone').add_style_class('passive-zone')
@@ -389,7 +588,12 @@ class ZoneDisplayWindow(TransparentApplicationWindow):
         Sets a new list of Preset objects for the ZoneDisplayWindow.
         :param preset: A new list of Preset objects.
         """
-        self.remove(self.__container)  # Remove the current container
-        # Create a new container with the new preset and add style classes
-        self.__container = ZoneContainer(preset).add_zone_style_class('zone-pane', 'passive-zone')
-        self.add(self.__container)  # Add the new container to the window
+        if self.__active_zone:
+            # ZonePanes are reused, so return the active zone to the passive style before assigning the new presets
+            self.__active_zone.remove_style_class('active-zone').add_style_class('passive-zone')
+            self.__active_zone = None
+
+        # Reuse the current container and its ZonePanes rather than replacing them
+        self.__container.set_preset(preset)
+        if not self.__container.is_visible():
+            self.__container.show_all()  # Show the container so the window itself only needs to be shown